@@ -3,25 +3,169 @@ import csv
 from email.mime import text
 import json
 import io
+import math
+import re
+from collections.abc import Callable
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
 
+try:
+    import orjson  # optional: much faster JSON parsing/serialization
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # optional: incremental JSON parsing for `to-csv --stream`
+except ImportError:
+    ijson = None
+
+
+# orjson silently turns integers outside the 64-bit range into floats; any integral
+# float at or beyond this magnitude sends the document back to the stdlib parser.
+_WIDE_INT_FLOAT = float(2**63)
+
+# Per-record checks use `type(record) is dict` rather than isinstance(): the JSON
+# decoders used here (json, orjson, ijson) only ever produce plain dicts for objects.
+
+
+def _any_float(obj, pred: Callable[[float], bool]) -> bool:
+    """True if pred holds for any float in obj, searching nested dicts and lists."""
+    t = type(obj)
+    if t is float:
+        return pred(obj)
+    if t is not dict and t is not list:
+        return False
+    for v in obj.values() if t is dict else obj:
+        t = type(v)
+        if t is float:
+            if pred(v):
+                return True
+        elif (t is dict or t is list) and _any_float(v, pred):
+            return True
+    return False
+
+
+def _is_wide_int_float(x: float) -> bool:
+    """Integral float with abs(x) >= 2**63: possibly an integer orjson widened to float."""
+    return abs(x) >= _WIDE_INT_FLOAT and x.is_integer()
+
+
+def _is_non_finite(x: float) -> bool:
+    """NaN or +/-Infinity, which orjson writes as null."""
+    return not math.isfinite(x)
+
+
+def json_loads(raw: bytes):
+    """Parse UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # let the stdlib parser decide (NaN literals, error messages, bad UTF-8)
+        else:
+            if not _any_float(data, _is_wide_int_float):
+                return data
+    # Decode explicitly: json.loads(bytes) would also accept a UTF-8 BOM and UTF-16/32
+    return json.loads(raw.decode("utf-8"))
+
+
+def json_dumps(data, pretty: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (compact unless pretty), using orjson when it is installed."""
+    # orjson would write NaN/Infinity as null; the stdlib keeps them
+    if orjson is not None and not _any_float(data, _is_non_finite):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits
+    if pretty:
+        # 2 spaces, matching orjson's only indent, so --pretty looks the same everywhere
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
 
 def infer_fields_from_json(data: dict) -> list[str]:
     """Infer CSV fields from dict-of-records JSON. Always includes 'id' first."""
-    keys: set[str] = set()
+    return _infer_fields(data.items())
+
+
+def _infer_fields(records) -> list[str]:
+    """Infer CSV fields from (key, record) pairs. Always includes 'id' first."""
+    keys: dict = {}
 
-    for k, record in data.items():
-        if not isinstance(record, dict):
+    for k, record in records:
+        if type(record) is not dict:
             raise ValueError(f"Record under key {k!r} is not an object/dict.")
-        keys.update(record.keys())
+        keys.update(record)
 
     # 'id' is reserved / handled separately
-    keys.discard("id")
+    keys.pop("id", None)
 
     # Deterministic ordering: alphabetical
     return ["id"] + sorted(keys)
 
 
+def iter_json_records(path: Path):
+    """Yield (key, record) pairs of a dict-of-records JSON file without loading it whole.
+    Requires the optional ijson package.
+    """
+    with path.open("rb") as f:
+        # kvitems() silently yields nothing for a non-object root, so check it first
+        first = next(ijson.parse(f), None)
+        if first is None or first[1] != "start_map":
+            raise ValueError("expected JSON root to be an object/dict (top-level { ... }).")
+        f.seek(0)
+        yield from ijson.kvitems(f, "", use_float=True)
+
+
+_SURROGATE_ESCAPE = re.compile(rb"\\u[dD][89a-fA-F][0-9a-fA-F]{2}")
+
+
+def has_lone_surrogate(path: Path, chunk_size: int = 1 << 20) -> bool:
+    """True if a JSON file contains an unpaired \\uD800-\\uDFFF escape.
+    Reads the file in chunks. ijson's C backend silently replaces such escapes with '?'.
+    """
+    with path.open("rb") as f:
+        data = b""
+        while True:
+            chunk = f.read(chunk_size)
+            data += chunk
+            if chunk:
+                # Hold back a full escape pair, plus any backslash run before it,
+                # so every escape is checked with its neighbours present
+                end = max(len(data) - 12, 0)
+                while end and data[end - 1] == 0x5C:
+                    end -= 1
+            else:
+                end = len(data)
+
+            resume = end
+            pair_low = -1
+            for m in _SURROGATE_ESCAPE.finditer(data):
+                p = m.start()
+                if p >= end:
+                    break
+                if p == pair_low:
+                    continue  # low half of a pair already checked
+                k = p
+                while k and data[k - 1] == 0x5C:
+                    k -= 1
+                if (p - k) % 2:
+                    continue  # escaped backslash followed by text, not a \\u escape
+                if data[p + 3] in b"89abAB":  # high surrogate: a low one must follow
+                    low = _SURROGATE_ESCAPE.match(data, p + 6)
+                    if low is None or data[p + 9] not in b"cdefCDEF":
+                        return True
+                    pair_low = p + 6
+                    resume = max(resume, p + 12)
+                else:
+                    return True  # low surrogate without a high one before it
+
+            if not chunk:
+                return False
+            data = data[resume:]
+
+
 def infer_fields_from_csv(fieldnames: list[str] | None) -> list[str]:
     """Infer fields from CSV headers. Requires 'id'. Keeps header order (with id first)."""
     if not fieldnames:
@@ -32,90 +176,247 @@ def infer_fields_from_csv(fieldnames: list[str] | None) -> list[str]:
     return ["id"] + [h for h in fieldnames if h != "id"]
 
 
-def json_to_csv_text(data: dict, fields: list[str]) -> str:
-    """Convert dict-of-records JSON to CSV text (in memory).
-    Row order follows the input JSON object's key order.
+def _write_csv(records, fields: list[str], writer) -> None:
+    """Write (key, record) pairs as CSV rows (header first) through a csv writer.
+    Row order follows the order of the pairs.
     """
-    buf = io.StringIO(newline="")
-    writer = csv.writer(buf)
-    writer.writerow(fields)
+    rest = fields[1:]  # 'id' is always first; its value is the record key
 
-    for key, record in data.items():  # preserve insertion order
-        if not isinstance(record, dict):
-            raise ValueError(f"Record under key {key!r} is not an object/dict.")
+    def rows():
+        yield fields
+        for key, record in records:  # preserve insertion order
+            if type(record) is not dict:
+                raise ValueError(f"Record under key {key!r} is not an object/dict.")
+            # Missing fields come back as None, which csv writes as an empty cell
+            yield [key, *map(record.get, rest)]
+
+    writer.writerows(rows())
 
-        row = []
-        for field in fields:
-            if field == "id":
-                row.append(key)
-            else:
-                row.append(record.get(field, ""))
-        writer.writerow(row)
 
+def json_to_csv_text(data: dict, fields: list[str]) -> str:
+    """Convert dict-of-records JSON to CSV text (in memory)."""
+    buf = io.StringIO(newline="")
+    _write_csv(data.items(), fields, csv.writer(buf))
     return buf.getvalue()
 
 
+_NUMERIC_LEADS = frozenset("0123456789+-.")
+_BOOL_LEADS = frozenset("tTfF")
+_BOOL_WORDS = {"true": True, "false": False}
+_NON_FINITE_LEADS = frozenset("+-iInN")
+_NON_FINITE_WORDS = frozenset({"inf", "infinity", "nan"})
+
 
 def maybe_parse_scalar(s: str):
-    """Optional lightweight type inference for CSV values."""
+    """Optional lightweight type inference for CSV values.
+    Dispatches on the first character so plain strings never go through int()/float().
+    """
     s2 = s.strip()
     if s2 == "":
         return ""
-    # int
-    try:
-        i = int(s2)
-        return i
-    except ValueError:
-        pass
-    # float
-    try:
-        f = float(s2)
-        return f
-    except ValueError:
-        pass
+    c = s2[0]
+    # inf / infinity / nan, optionally signed (what csv writes for non-finite floats)
+    if c in _NON_FINITE_LEADS:
+        body = s2[1:] if c in "+-" else s2
+        if body.lower() in _NON_FINITE_WORDS:
+            return float(s2)
+    # int / float (int()/float() also accept non-ASCII decimal digits, e.g. '１２', '١٢')
+    if c in _NUMERIC_LEADS or c.isdecimal():
+        try:
+            if "." in s2 or "e" in s2 or "E" in s2:
+                return float(s2)
+            return int(s2)
+        except ValueError:
+            return s
     # bool-ish
-    low = s2.lower()
-    if low == "true":
-        return True
-    if low == "false":
-        return False
+    if c in _BOOL_LEADS:
+        b = _BOOL_WORDS.get(s2.lower())
+        if b is not None:
+            return b
     return s
 
 
-def csv_text_to_json(text: str, fields: list[str], infer_types: bool) -> dict:
+def _classify_cell(s: str) -> type | None:
+    """Classify a CSV cell as int, bool or str (None if empty) using character checks only.
+    Never raises; anything that is not clearly an int or a bool counts as str.
+    """
+    s2 = s.strip()
+    if s2 == "":
+        return None
+    c = s2[0]
+    if c in _NUMERIC_LEADS:
+        digits = s2[1:] if c in "+-" else s2
+        return int if digits.isascii() and digits.isdigit() else str
+    if c in _BOOL_LEADS and s2.lower() in _BOOL_WORDS:
+        return bool
+    return str
+
+
+def _parse_int_cell(s: str):
+    """Parser for columns sampled as int. Falls back to maybe_parse_scalar on mismatch."""
+    if s.isascii():
+        try:
+            return int(s)
+        except ValueError:
+            pass
+    return maybe_parse_scalar(s)
+
+
+def _parse_bool_cell(s: str):
+    """Parser for columns sampled as bool. Falls back to maybe_parse_scalar on mismatch."""
+    b = _BOOL_WORDS.get(s.strip().lower())
+    return maybe_parse_scalar(s) if b is None else b
+
+
+def infer_column_parsers(
+    sample: list[list[str]], idx_map: tuple[tuple[str, int], ...]
+) -> list[Callable[[str], object]]:
+    """Pick one parser per column (aligned with idx_map) from a sample of rows.
+    Columns whose non-empty sampled values are all ints or all bools get a direct parser;
+    anything else keeps the general maybe_parse_scalar dispatch.
+    """
+    # Classify column by column over the transposed sample
+    columns = list(zip(*sample))
+    parsers: list[Callable[[str], object]] = []
+    for _, i in idx_map:
+        kinds = set(map(_classify_cell, columns[i])) if columns else set()
+        kinds.discard(None)
+        if kinds == {int}:
+            parsers.append(_parse_int_cell)
+        elif kinds == {bool}:
+            parsers.append(_parse_bool_cell)
+        else:
+            parsers.append(maybe_parse_scalar)
+    return parsers
+
+
+@lru_cache(maxsize=128)
+def _derive_schema(header: tuple[str, ...]) -> tuple[int, tuple[tuple[str, int], ...]]:
+    """Column position of 'id' and the (field, column) pairs of all other fields.
+    Cached per header so repeated conversions of the same schema skip this work.
+    """
+    return header.index("id"), tuple((h, i) for i, h in enumerate(header) if h != "id")
+
+
+@lru_cache(maxsize=128)
+def _compile_record_builder(
+    idx_map: tuple[tuple[str, int], ...], parsers: tuple[Callable[[str], object], ...]
+) -> Callable[[list[str]], dict]:
+    """Generate a row -> record function with every column index and parser inlined,
+    e.g. `def make_record(r): return {'name': r[1], 'stars': _p1(r[2])}`.
+    Columns parsed as str take the cell as-is, without a call.
+    """
+    items = ", ".join(
+        f"{field!r}: r[{i}]" if parse is str else f"{field!r}: _p{j}(r[{i}])"
+        for j, ((field, i), parse) in enumerate(zip(idx_map, parsers))
+    )
+    src = f"def make_record(r):\n    return {{{items}}}\n"
+    namespace = {f"_p{j}": parse for j, parse in enumerate(parsers)}
+    exec(src, namespace)
+    return namespace["make_record"]
+
+
+def csv_text_to_json(text: str, fields: list[str], infer_types: bool, sample_rows: int = 100) -> dict:
     """Convert CSV text back into dict-of-records JSON (in memory)."""
     buf = io.StringIO(text, newline="")
-    reader = csv.DictReader(buf)
-
-    file_fields = infer_fields_from_csv(reader.fieldnames)
-    missing = [h for h in file_fields if h not in (reader.fieldnames or [])]
-    if missing:
-        raise ValueError(f"CSV missing required headers: {missing}; found: {reader.fieldnames}")
+    reader = csv.reader(buf)
+    header = next(reader, None)
 
     # Use the provided fields ordering, but ensure it matches what's actually in the CSV
     # (fields may be inferred from JSON; CSV headers are the source of truth here)
-    fields = file_fields
+    infer_fields_from_csv(header)
 
+    return _rows_to_json(reader, header, infer_types, sample_rows)
+
+
+def _rows_to_json(reader, header: list[str], infer_types: bool, sample_rows: int = 100) -> dict:
+    """Convert parsed CSV rows (header already consumed) into dict-of-records JSON.
+    With infer_types, column types are decided from the first sample_rows rows.
+    """
+    # Resolve column positions once so rows can be read as plain lists
+    id_idx, idx_map = _derive_schema(tuple(header))
+    width = len(header)
+
+    def rows():
+        for row in reader:
+            if not row:
+                continue  # blank line
+            if len(row) < width:
+                row += [""] * (width - len(row))  # short row: missing cells are empty
+            yield row
+
+    remaining = rows()
+    sample = list(islice(remaining, sample_rows))
+    if infer_types:
+        parsers = tuple(infer_column_parsers(sample, idx_map))
+    else:
+        parsers = (str,) * len(idx_map)
+    make_record = _compile_record_builder(idx_map, parsers)
+
+    # Filled incrementally on purpose: CPython cannot pre-size a dict, growth is amortized
+    # O(1) per insert, and dict(pairs) / dict(map(...)) measured slower than this loop.
     data: dict[str, dict] = {}
 
-    for row in reader:
-        raw_id = (row.get("id") or "").strip()
-        if raw_id == "":
+    for row in chain(sample, remaining):
+        id_key = row[id_idx].strip()  # keep exactly what's in CSV
+        if id_key == "":
             raise ValueError("CSV row missing id.")
-        id_key = raw_id  # keep exactly what's in CSV
 
-        record: dict = {}
-        for field in fields:
-            if field == "id":
-                continue
-            val = row.get(field, "")
-            record[field] = maybe_parse_scalar(val) if infer_types else val
-
-        data[id_key] = record
+        data[id_key] = make_record(row)
 
     return data
 
 
+def _verify_roundtrip(data: dict, fields: list[str], infer_types: bool) -> bool:
+    """Check that dict-of-records JSON survives JSON -> CSV -> JSON unchanged.
+    Each record is written as a CSV row and read straight back, one at a time;
+    stops at the first mismatch instead of building the whole round-trip.
+    """
+    # An empty id fails the conversion wherever it appears, so reject it before the
+    # loop below can return early on an unrelated mismatch
+    for key in data:
+        if key.strip() == "":
+            raise ValueError("CSV row missing id.")
+
+    rest = fields[1:]  # 'id' is always first; its value is the record key
+    buf = io.StringIO(newline="")
+    writer = csv.writer(buf)
+
+    for key, record in data.items():
+        buf.seek(0)
+        buf.truncate()
+        writer.writerow([key, *map(record.get, rest)])
+        buf.seek(0)
+        row = next(csv.reader(buf))
+
+        id_key = row[0].strip()
+        if infer_types:
+            values = [maybe_parse_scalar(val) for val in row[1:]]
+        else:
+            values = row[1:]
+        if id_key != key or dict(zip(rest, values)) != record:
+            return False
+
+    return True
+
+
+def _load_json_dict(path: Path) -> tuple[dict | None, int, str | None]:
+    """Read and parse a JSON file whose root must be an object.
+    Returns (data, 0, None) on success, or (None, exit_code, error_message).
+    """
+    try:
+        data = json_loads(path.read_bytes())
+    except UnicodeDecodeError as e:
+        return None, 2, f"ERROR: failed to decode input file as UTF-8: {path}\n  {e}"
+    except json.JSONDecodeError as e:
+        return None, 2, f"ERROR: invalid JSON: {path}\n  {e}"
+
+    if not isinstance(data, dict):
+        return None, 2, "ERROR: expected JSON root to be an object/dict (top-level { ... })."
+
+    return data, 0, None
+
+
 def cmd_ping(args: argparse.Namespace) -> int:
     print("pong")
     return 0
@@ -138,34 +439,52 @@ def cmd_to_csv(args: argparse.Namespace) -> int:
         print("Use --force to overwrite.")
         return 2
 
-    try:
-        text = in_path.read_text(encoding="utf-8")
-    except UnicodeDecodeError as e:
-        print(f"ERROR: failed to decode input file as UTF-8: {in_path}")
-        print(f"  {e}")
-        return 2
-    
-    try:
-        data = json.loads(text)
-    except json.JSONDecodeError as e:
-        print(f"ERROR: invalid JSON: {in_path}")
-        print(f"  {e}")
-        return 2
-    
-    if not isinstance(data, dict):
-        print("ERROR: expected JSON root to be an object/dict (top-level { ... }).")
-        return 2
-
-    try:
-        fields = infer_fields_from_json(data)
-    except ValueError as e:
-        print(f"ERROR: {e}")
-        return 2
+    if args.stream:
+        if ijson is None:
+            print("ERROR: --stream requires the optional 'ijson' package (pip install ijson).")
+            return 2
+
+        # Two passes over the file: collect field names, then write rows
+        try:
+            fields = _infer_fields(iter_json_records(in_path))
+        except UnicodeDecodeError as e:
+            print(f"ERROR: failed to decode input file as UTF-8: {in_path}")
+            print(f"  {e}")
+            return 2
+        except ijson.JSONError as e:
+            print(f"ERROR: invalid JSON: {in_path}")
+            print(f"  {e}")
+            return 2
+        except ValueError as e:
+            print(f"ERROR: {e}")
+            return 2
+
+        # The default path fails on these too; ijson would write them as '?'
+        if has_lone_surrogate(in_path):
+            print(f"ERROR: invalid JSON: {in_path}")
+            print("  string contains an unpaired surrogate escape (\\ud800-\\udfff)")
+            return 2
+
+        records = iter_json_records(in_path)
+    else:
+        data, code, err = _load_json_dict(in_path)
+        if data is None:
+            print(err)
+            return code
+
+        try:
+            fields = infer_fields_from_json(data)
+        except ValueError as e:
+            print(f"ERROR: {e}")
+            return 2
+
+        records = data.items()
 
     try:
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        with out_path.open("w", encoding="utf-8", newline="") as f:
-            f.write(json_to_csv_text(data, fields))
+        # Stream rows straight to disk through a large buffer
+        with out_path.open("w", encoding="utf-8", newline="", buffering=1 << 20) as f:
+            _write_csv(records, fields, csv.writer(f))
     except OSError as e:
         print(f"ERROR: failed to write output file: {out_path}")
         print(f"  {e}")
@@ -198,26 +517,26 @@ def cmd_to_json(args: argparse.Namespace) -> int:
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
+        # Single pass over the file: header first, then rows straight into records
         with in_path.open("r", encoding="utf-8", newline="") as f:
-            text = f.read()
+            reader = csv.reader(f)
+            # fields come from CSV headers
+            header_row = next(reader)
+            fields = infer_fields_from_csv(header_row)
+            data = _rows_to_json(reader, header_row, infer_types=args.infer_types)
     except UnicodeDecodeError as e:
         print(f"ERROR: failed to decode input file as UTF-8: {in_path}")
         print(f"  {e}")
         return 2
-
-    try:    
-        # fields come from CSV headers
-        header_row = next(csv.reader(io.StringIO(text, newline="")))
-        fields = infer_fields_from_csv(header_row)
-        data = csv_text_to_json(text, fields, infer_types=args.infer_types)
     except StopIteration:
         print("ERROR: CSV has no headers (file is empty).")
         return 2
     except ValueError as e:
         print(f"ERROR: {e}")
         return 2
+
     try:
-        out_path.write_text(json.dumps(data, indent=4, ensure_ascii=False) + "\n", encoding="utf-8")
+        out_path.write_bytes(json_dumps(data, pretty=args.pretty) + b"\n")
     except OSError as e:
         print(f"ERROR: failed to write output file: {out_path}")
         print(f"  {e}")
@@ -237,32 +556,23 @@ def cmd_verify(args: argparse.Namespace) -> int:
         print(f"ERROR: input JSON not found: {in_path}")
         return 2
 
-    try:
-        text = in_path.read_text(encoding="utf-8")
-    except UnicodeDecodeError as e:
-        print(f"ERROR: failed to decode input file as UTF-8: {in_path}")
-        print(f"  {e}")
-        return 2
-    try:
-        original = json.loads(text)
-    except json.JSONDecodeError as e:
-        print(f"ERROR: invalid JSON: {in_path}")
-        print(f"  {e}")
-        return 2
-    
-    if not isinstance(original, dict):
-        print("ERROR: expected JSON root to be an object/dict (top-level { ... }).")
-        return 2
+    original, code, err = _load_json_dict(in_path)
+    if original is None:
+        print(err)
+        return code
 
     try:
         fields = infer_fields_from_json(original)
-        csv_text = json_to_csv_text(original, fields)
-        roundtrip = csv_text_to_json(csv_text, fields, infer_types=args.infer_types)
+        lossless = _verify_roundtrip(original, fields, infer_types=args.infer_types)
+        if not lossless and args.verbose:
+            # Diagnostics need the full round-trip result; only build it when asked for
+            csv_text = json_to_csv_text(original, fields)
+            roundtrip = csv_text_to_json(csv_text, fields, infer_types=args.infer_types)
     except ValueError as e:
         print(f"ERROR: verify failed during conversion: {e}")
         return 2
 
-    if original == roundtrip:
+    if lossless:
         print("VERIFY: PASS (JSON -> CSV -> JSON is lossless for current schema)")
         if args.verbose:
             print(f"[verbose] fields={fields}")
@@ -272,10 +582,12 @@ def cmd_verify(args: argparse.Namespace) -> int:
     if args.verbose:
         print(f"[verbose] fields={fields}")
 
-        original_keys = set(original.keys())
-        roundtrip_keys = set(roundtrip.keys())
-        missing = [k for k in original.keys() if k not in roundtrip]
-        extra = [k for k in roundtrip.keys() if k not in original]
+        # Set difference on key views runs in C; only walk the dicts again
+        # (to report keys in their original order) when something differs
+        missing_keys = original.keys() - roundtrip.keys()
+        extra_keys = roundtrip.keys() - original.keys()
+        missing = [k for k in original if k in missing_keys] if missing_keys else []
+        extra = [k for k in roundtrip if k in extra_keys] if extra_keys else []
 
         if missing:
             print(f"[verbose] missing keys: {missing[:10]}{'...' if len(missing) > 10 else ''}")
@@ -305,6 +617,7 @@ def build_parser() -> argparse.ArgumentParser:
     p_to_csv.add_argument("input", type=Path, help="Input JSON file path")
     p_to_csv.add_argument("output", type=Path, help="Output CSV file path")
     p_to_csv.add_argument("--force", action="store_true", help="Overwrite output file if it exists")
+    p_to_csv.add_argument("--stream", action="store_true", help="Stream the input instead of loading it whole (requires ijson)")
     p_to_csv.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
     p_to_csv.set_defaults(func=cmd_to_csv)
 
@@ -313,6 +626,7 @@ def build_parser() -> argparse.ArgumentParser:
     p_to_json.add_argument("output", type=Path, help="Output JSON file path")
     p_to_json.add_argument("--force", action="store_true", help="Overwrite output file if it exists")
     p_to_json.add_argument("--infer-types", action="store_true", help="Try to infer ints/floats/bools from CSV values")
+    p_to_json.add_argument("--pretty", action="store_true", help="Indent the output JSON (default: compact)")
     p_to_json.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
     p_to_json.set_defaults(func=cmd_to_json)
 